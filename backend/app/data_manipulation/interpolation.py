@@ -1,6 +1,7 @@
 from __future__ import annotations
 from typing import Self, Optional
 from abc import ABC, abstractmethod
+from bisect import bisect_right
 
 
 class InterpolationAbstract(ABC):
@@ -93,9 +94,7 @@ class LinearInterpolation(InterpolationAbstract):
         return out
 
     def __call__(self, x: float) -> float:
-        i = self.n
-        while i >= 0 and x < self.x[i]:
-            i -= 1
+        i = bisect_right(self.x, x) - 1
 
         a, b = self.lines[i + 1]
         return a * x + b
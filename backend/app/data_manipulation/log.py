@@ -7,96 +7,75 @@ from math import sqrt
 from .interpolation import InterpolationAbstract
 
 
-class Record(dict):
-    s_date = dt.datetime(dt.MINYEAR, 1, 1)
-
-    def __init__(self, datetime: dt.datetime | float, measure: float, **other):
-        if isinstance(datetime, (float, int)):
-            datetime = self.s_date + dt.timedelta(seconds=datetime)
-        super().__init__({'datetime': datetime, 'measure': measure, **other})
-
-    @classmethod
-    def from_row(cls, headers: tuple[str], row: tuple[Any, ...]) -> Record:
-        if 'datetime' not in headers or 'measure' not in headers:
-            raise ValueError("Headers must contain 'datetime' and 'measure'.")
-        return cls(**{header: value for header, value in zip(headers, row)})
-
-    @property
-    def datetime(self) -> dt.datetime:
-        return self['datetime']
-
-    @property
-    def measure(self) -> float:
-        return self['measure']
-
-    @property
-    def other(self) -> dict[str, Any]:
-        return {k: v for k, v in self.items() if k not in ('datetime', 'measure')}
-
-    def __repr__(self):
-        return f"{self.__class__.__name__}(time={repr(self.datetime)}, measure={self.measure}, **{self.other})"
-
-    @property
-    def time_as_float(self) -> float:
-        return (self.datetime - self.s_date).total_seconds()
+S_DATE = dt.datetime(dt.MINYEAR, 1, 1)
 
 
 class WatchLogFrame:
 
-    __slots__ = 'data'
+    __slots__ = 'times', 'measures', 'columns', '_differences'
 
-    def __init__(self, data: list[Record]):
-        assert list(sorted(data, key=lambda x: x.datetime)) == data
-        self.data: list[Record] = data.copy()
+    def __init__(self, times: list[dt.datetime], measures: list[float], **columns: list[Any]):
+        assert list(sorted(times)) == times
+        self.times: list[dt.datetime] = times
+        self.measures: list[float] = measures
+        self.columns: dict[str, list[Any]] = columns
+        self._differences: list[float] | None = None
+
+    @staticmethod
+    def _check_headers(headers: tuple[str]):
+        if 'datetime' not in headers or 'measure' not in headers:
+            raise ValueError("Headers must contain 'datetime' and 'measure'.")
 
     @classmethod
     def from_table(cls, headers: tuple[str], table: list[tuple[Any, ...]]) -> WatchLogFrame:
-        return cls([Record.from_row(headers, row) for row in table])
+        cls._check_headers(headers)
+        columns = {header: list(column) for header, column in zip(headers, zip(*table))}
+        if not columns:
+            columns = {header: [] for header in headers}
+        return cls(columns.pop('datetime'), columns.pop('measure'), **columns)
 
-    def difference(self, index: int) -> float | None:
-        if not (0 <= index < len(self.data)):
-            raise IndexError("Index has to be 0 <= index < len(data).")
-        if index == 0:
-            return None
-        current = self.data[index]
-        previous = self.data[index - 1]
-        return round(current.measure - previous.measure, 1)
+    def to_dicts(self) -> list[dict[str, Any]]:
+        names = ('datetime', 'measure', *self.columns)
+        return [dict(zip(names, row)) for row in zip(self.times, self.measures, *self.columns.values())]
 
     def get_log_with_dif(self) -> WatchLogFrame:
-        table = []
-        for i, entry in enumerate(self.data):
-            table.append(Record(**entry, difference=self.difference(i)))
-        return self.__class__(table)
+        difference = [None, *self.differences] if self.measures else []
+        return self.__class__(self.times, self.measures, **self.columns, difference=difference)
 
     def fill(self, interpolation_method: type[InterpolationAbstract]) -> WatchLogFrame:
         SECONDS_IN_DAY = 24 * 60 * 60
 
-        data = [(record.time_as_float, record.measure) for record in self.data]
-        if len(self.data) == 0:
-            return self.__class__([])
+        if len(self.times) == 0:
+            return self.__class__([], [])
 
-        f = interpolation_method.calculate(data)
-        start = int(self.data[0].time_as_float)
-        end = int(self.data[-1].time_as_float)
+        seconds = [(time - S_DATE).total_seconds() for time in self.times]
+        f = interpolation_method.calculate(list(zip(seconds, self.measures)))
 
-        table = []
-        for time in range(start, end + 1, SECONDS_IN_DAY):
-            table.append(Record(datetime=time, measure=round(f(time), 1)))
+        grid = range(int(seconds[0]), int(seconds[-1]) + 1, SECONDS_IN_DAY)
+        times = [S_DATE + dt.timedelta(seconds=time) for time in grid]
+        measures = [round(f(time), 1) for time in grid]
 
-        return self.__class__(table)
+        return self.__class__(times, measures)
+
+    @property
+    def differences(self) -> list[float]:
+        if self._differences is None:
+            self._differences = [round(current - previous, 1)
+                                 for previous, current in zip(self.measures, self.measures[1:])]
+        return self._differences
 
     @property
     def average(self) -> float:
-        data = [self.difference(i) for i in range(1, len(self.data))]
+        data = self.differences
         return round(sum(data) / len(data), 2)
 
     @property
     def standard_deviation(self) -> float:
-        data = [self.difference(i) for i in range(1, len(self.data))]
+        data = self.differences
         avg = self.average
         return round(sqrt(sum((x - avg)**2 for x in data) / len(data)), 2)
 
     @property
     def delta(self) -> float:
-        data = [self.difference(i) for i in range(1, len(self.data))]
+        data = self.differences
         return round(max(data) - min(data), 2)
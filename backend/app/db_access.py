@@ -1,5 +1,8 @@
+import asyncio
+
 from mysql.connector.aio import connect, MySQLConnection
 from mysql.connector.aio.cursor import MySQLCursor
+from mysql.connector.errors import Error
 
 
 class DBWrapper:
@@ -16,27 +19,90 @@ class DBWrapper:
         await self._db.commit()
 
 
-class DBContext:
+class DBPool:
 
-    def __init__(self, db_credentials: dict):
+    def __init__(self, db_credentials: dict, size: int):
         self.db_credentials = db_credentials
+        self._slots = asyncio.Semaphore(size)
+        self._idle: list[MySQLConnection] = []
+
+    async def acquire(self) -> MySQLConnection:
+        await self._slots.acquire()
+        try:
+            if not self._idle:
+                return await connect(**self.db_credentials)
+            conn = self._idle.pop()
+        except BaseException:
+            self._slots.release()
+            raise
+        try:
+            # the server drops connections that stay idle for too long
+            await conn.ping(reconnect=True)
+        except BaseException:
+            await self._discard(conn)
+            raise
+        return conn
+
+    async def release(self, conn: MySQLConnection):
+        try:
+            # never hand out a connection with an open transaction (and its stale snapshot)
+            if conn.in_transaction:
+                await conn.rollback()
+        except Error:
+            await self._discard(conn)
+            return
+        except BaseException:
+            await self._discard(conn)
+            raise
+        self._idle.append(conn)
+        self._slots.release()
+
+    async def close(self):
+        while self._idle:
+            await self._close(self._idle.pop())
+
+    async def _discard(self, conn: MySQLConnection):
+        self._slots.release()
+        await self._close(conn)
+
+    @staticmethod
+    async def _close(conn: MySQLConnection):
+        try:
+            await conn.close()
+        except Error:
+            pass
+
+
+class DBContext:
+
+    def __init__(self, pool: DBPool):
+        self.pool = pool
 
     async def __aenter__(self) -> DBWrapper:
-        self.conn = await connect(**self.db_credentials)
-        self.cursor = await self.conn.cursor()
+        self.conn = await self.pool.acquire()
+        try:
+            self.cursor = await self.conn.cursor()
+        except BaseException:
+            await self.pool.release(self.conn)
+            raise
         return DBWrapper(self.conn, self.cursor)
 
     async def __aexit__(self, exc_type, exc_value, traceback):
-        await self.cursor.close()
-        await self.conn.close()
+        try:
+            await self.cursor.close()
+        finally:
+            await self.pool.release(self.conn)
         if exc_type:
             raise exc_value.with_traceback(traceback)
 
 
 class DBAccess:
 
-    def __init__(self, db_credentials: dict):
-        self.credentials = db_credentials
+    def __init__(self, db_credentials: dict, pool_size: int):
+        self.pool = DBPool(db_credentials, pool_size)
 
     def access(self) -> DBContext:
-        return DBContext(self.credentials)
+        return DBContext(self.pool)
+
+    async def close(self):
+        await self.pool.close()
@@ -1,4 +1,9 @@
+import json
+from contextlib import asynccontextmanager
+from typing import Literal
+
 from fastapi import FastAPI, Request, HTTPException
+from fastapi.responses import ORJSONResponse
 from mysql.connector.errors import IntegrityError
 from pydantic import BaseModel
 from starlette.middleware.cors import CORSMiddleware
@@ -6,11 +11,20 @@ from starlette.middleware.cors import CORSMiddleware
 import settings
 from .data_manipulation.interpolation import LinearInterpolation
 from .data_manipulation.log import WatchLogFrame
+from . import queries
 from .db_access import DBAccess
 from .utils import convert_table
 
-app = FastAPI()
-db = DBAccess(settings.DATABASE_CONFIG)
+db = DBAccess(settings.DATABASE_CONFIG, settings.DATABASE_POOL_SIZE)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    await db.close()
+
+
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
 
 app.add_middleware(
     CORSMiddleware,
@@ -24,12 +38,11 @@ app.add_middleware(
 @app.get('/watchlist')
 async def watchlist(request: Request):
     async with db.access() as wp:
-        await wp.cursor.execute('SELECT watch_id, name FROM info')
-        watches = convert_table(('id', 'name'), await wp.cursor.fetchall())
-        for watch in watches:
-            await wp.cursor.execute('SELECT DISTINCT cycle FROM logs WHERE watch_id = %s',
-                                    (watch['id'],))
-            watch['cycles'] = [t[0] for t in await wp.cursor.fetchall()]
+        await wp.cursor.execute(queries.WATCHLIST)
+        watches = convert_table(('id', 'name', 'cycles'), await wp.cursor.fetchall())
+    for watch in watches:
+        # a watch without logs aggregates to [null]
+        watch['cycles'] = sorted(cycle for cycle in json.loads(watch['cycles']) if cycle is not None)
     return watches
 
 
@@ -41,7 +54,7 @@ class AddWatchRequest(BaseModel):
 async def add_watch(request: AddWatchRequest):
     async with db.access() as wp:
         try:
-            await wp.cursor.execute('INSERT INTO info (name) VALUES (%s)', (request.name,))
+            await wp.cursor.execute(queries.INSERT_WATCH, (request.name,))
         except IntegrityError:
             raise HTTPException(status_code=400, detail='Failed to insert.')
         await wp.commit()
@@ -51,8 +64,8 @@ async def add_watch(request: AddWatchRequest):
 @app.delete('/watchlist/{watch_id}')
 async def delete_watch(request: Request, watch_id: int):
     async with db.access() as wp:
-        await wp.cursor.execute('DELETE FROM logs WHERE watch_id = %s', (watch_id,))
-        await wp.cursor.execute('DELETE FROM info WHERE watch_id = %s', (watch_id,))
+        await wp.cursor.execute(queries.DELETE_WATCH_LOGS, (watch_id,))
+        await wp.cursor.execute(queries.DELETE_WATCH, (watch_id,))
         if wp.cursor.rowcount == 0:
             raise HTTPException(status_code=400, detail='Watch not found.')
         await wp.commit()
@@ -62,32 +75,33 @@ async def delete_watch(request: Request, watch_id: int):
 @app.get('/measurements/{watch_id}/{cycle}')
 async def measurements(request: Request, watch_id: int, cycle: int):
     async with db.access() as wp:
-        await wp.cursor.execute(
-            '''
-            SELECT log_id, timedate, measure
-            FROM logs
-            WHERE watch_id = %s AND cycle = %s
-            ORDER BY timedate;
-            ''',
-            (watch_id, cycle)
-        )
+        await wp.cursor.execute(queries.CYCLE_LOGS, (watch_id, cycle))
         table = await wp.cursor.fetchall()
     frame = WatchLogFrame.from_table(('log_id', 'datetime', 'measure'), table).get_log_with_dif()
-    return frame.data
+    return frame.to_dicts()
 
 
 @app.get('/stats/{watch_id}/{cycle}')
-async def stats(request: Request, watch_id: int, cycle: int):
+async def stats(request: Request, watch_id: int, cycle: int, fill: Literal['linear', 'none'] = 'linear'):
+    not_available = {
+        'average': 'N/A',
+        'deviation': 'N/A',
+        'delta': 0
+    }
+    if fill == 'none':
+        async with db.access() as wp:
+            await wp.cursor.execute(queries.CYCLE_STATS, (watch_id, cycle))
+            average, deviation, delta = await wp.cursor.fetchone()
+        if average is None:
+            return not_available
+        return {
+            'average': average,
+            'deviation': deviation,
+            'delta': delta
+        }
+
     async with db.access() as wp:
-        await wp.cursor.execute(
-            '''
-            SELECT log_id, timedate, measure
-            FROM logs
-            WHERE watch_id = %s AND cycle = %s
-            ORDER BY timedate;
-            ''',
-            (watch_id, cycle)
-        )
+        await wp.cursor.execute(queries.CYCLE_LOGS, (watch_id, cycle))
         table = await wp.cursor.fetchall()
     frame = (WatchLogFrame.from_table(('log_id', 'datetime', 'measure'), table)
              .fill(LinearInterpolation))
@@ -98,18 +112,14 @@ async def stats(request: Request, watch_id: int, cycle: int):
             'delta': frame.delta
         }
     except ZeroDivisionError:
-        out = {
-            'average': 'N/A',
-            'deviation': 'N/A',
-            'delta': 0
-        }
+        out = not_available
     return out
 
 
 @app.delete('/measurements/{log_id}')
 async def delete_measurement(request: Request, log_id: int):
     async with db.access() as wp:
-        await wp.cursor.execute('DELETE FROM logs WHERE log_id = %s', (log_id,))
+        await wp.cursor.execute(queries.DELETE_LOG, (log_id,))
         if wp.cursor.rowcount == 0:
             raise HTTPException(status_code=400, detail='Log not found.')
         await wp.commit()
@@ -121,18 +131,26 @@ class CreateMeasurementRequest(BaseModel):
     measure: float
 
 
-@app.post('/measurements/{watch_id}/{cycle}')
-async def add_measurement(request: CreateMeasurementRequest, watch_id: int, cycle: int):
+async def insert_measurements(watch_id: int, cycle: int, measurements: list[CreateMeasurementRequest]):
     async with db.access() as wp:
         try:
-            await wp.cursor.execute(
-                '''
-                INSERT INTO logs (watch_id, cycle, timedate, measure)
-                VALUES (%s, %s, %s, %s);
-                ''',
-                (watch_id, cycle, request.datetime, request.measure)
+            await wp.cursor.executemany(
+                queries.INSERT_LOG,
+                [(watch_id, cycle, m.datetime, m.measure) for m in measurements]
             )
         except IntegrityError:
             raise HTTPException(status_code=400, detail='Failed to insert.')
         await wp.commit()
+
+
+@app.post('/measurements/{watch_id}/{cycle}')
+async def add_measurement(request: CreateMeasurementRequest, watch_id: int, cycle: int):
+    await insert_measurements(watch_id, cycle, [request])
+    return {'status': 'ok'}
+
+
+@app.post('/measurements/{watch_id}/{cycle}/bulk')
+async def add_measurements(request: list[CreateMeasurementRequest], watch_id: int, cycle: int):
+    if request:
+        await insert_measurements(watch_id, cycle, request)
     return {'status': 'ok'}
@@ -0,0 +1,28 @@
+WATCHLIST = (
+    'SELECT info.watch_id, info.name, JSON_ARRAYAGG(cycles.cycle) '
+    'FROM info LEFT JOIN (SELECT DISTINCT watch_id, cycle FROM logs) AS cycles '
+    'ON cycles.watch_id = info.watch_id '
+    'GROUP BY info.watch_id, info.name ORDER BY info.watch_id'
+)
+
+INSERT_WATCH = 'INSERT INTO info (name) VALUES (%s)'
+
+DELETE_WATCH_LOGS = 'DELETE FROM logs WHERE watch_id = %s'
+
+DELETE_WATCH = 'DELETE FROM info WHERE watch_id = %s'
+
+CYCLE_LOGS = (
+    'SELECT log_id, timedate, measure FROM logs '
+    'WHERE watch_id = %s AND cycle = %s ORDER BY timedate'
+)
+
+CYCLE_STATS = (
+    'SELECT ROUND(AVG(difference), 2), ROUND(STDDEV_POP(difference), 2), '
+    'ROUND(MAX(difference) - MIN(difference), 2) '
+    'FROM (SELECT ROUND(measure - LAG(measure) OVER (ORDER BY timedate), 1) AS difference '
+    'FROM logs WHERE watch_id = %s AND cycle = %s) AS differences'
+)
+
+DELETE_LOG = 'DELETE FROM logs WHERE log_id = %s'
+
+INSERT_LOG = 'INSERT INTO logs (watch_id, cycle, timedate, measure) VALUES (%s, %s, %s, %s)'
@@ -20,3 +20,4 @@ DATABASE_CONFIG = {
     'database': _get_env_raise('DB_NAME'),
     # 'raise_on_warnings': True
 }
+DATABASE_POOL_SIZE = int(os.getenv('DB_POOL_SIZE', '5'))
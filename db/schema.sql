@@ -5,7 +5,8 @@ CREATE TABLE info
 (
     watch_id        INT AUTO_INCREMENT PRIMARY KEY,
     name            VARCHAR(50),
-    date_of_joining DATETIME
+    date_of_joining DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE INDEX idx_info_name (name)
 );
 
 CREATE TABLE logs
@@ -13,7 +14,8 @@ CREATE TABLE logs
     log_id   INT AUTO_INCREMENT PRIMARY KEY,
     watch_id INT      NOT NULL,
     cycle    INT      NOT NULL,
-    timedate DATETIME NOT NULL,
+    timedate DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
     measure  FLOAT    NOT NULL,
+    INDEX idx_logs_watch_cycle_time (watch_id, cycle, timedate, measure),
     FOREIGN KEY (watch_id) REFERENCES info (watch_id)
 );